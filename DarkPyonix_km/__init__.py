@@ -2,7 +2,6 @@
 DarkPyonix-lite - Sticky Kernel Manager for Jupyter
 """
 
-from .manager import StickyMappingKernelManager, StickySessionManager
 from .config import create_config, check_installation
 
 __version__ = "1.0.0"
@@ -12,4 +11,19 @@ __all__ = [
     "StickySessionManager",
     "create_config",
     "check_installation"
-]
\ No newline at end of file
+]
+
+_LAZY_MANAGER_NAMES = ("StickyMappingKernelManager", "StickySessionManager")
+
+def __getattr__(name):
+    # Import the manager (and jupyter_server) only when its classes are requested,
+    # so the darkpyonix-config CLI starts without that cost.
+    if name in _LAZY_MANAGER_NAMES:
+        from . import manager
+        value = getattr(manager, name)
+        globals()[name] = value  # later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MANAGER_NAMES))
@@ -3,22 +3,20 @@
 
 import os
 import sys
+import re
+import mmap
 import argparse
+from contextlib import contextmanager
 from pathlib import Path
 
-def get_venv_jupyter_config_dir():
-    """Get Jupyter config directory in current virtual environment"""
-    venv_path = Path(sys.prefix)
-    return venv_path / "etc" / "jupyter"
-
-def create_config():
-    """Create or recreate Jupyter server configuration file"""
-    config_dir = get_venv_jupyter_config_dir()
-    config_dir.mkdir(parents=True, exist_ok=True)
-
-    config_file = config_dir / "jupyter_server_config.py"
+# A line mentioning DarkPyonix, plus the c./#/print/blank lines that follow it
+_DARKPYONIX_BLOCK_RE = re.compile(
+    r"^.*(?:DarkPyonix|StickyMappingKernelManager|StickySessionManager).*(?:\n|\Z)"
+    r"(?:(?:c\.|#|print).*(?:\n|\Z)|[^\S\n]*(?:\n|\Z))*",
+    re.MULTILINE,
+)
 
-    config_content = '''# DarkPyonix Configuration
+_CONFIG_TEMPLATE = '''# DarkPyonix Configuration
 # Sticky Kernel Manager for file-based kernel reuse
 
 c.ServerApp.kernel_manager_class = 'DarkPyonix_km.manager.StickyMappingKernelManager'
@@ -38,21 +36,81 @@ print("🚀 [DarkPyonix] Sticky Kernel Manager activated!")
 print("📝 [DarkPyonix] Same file path → Same kernel reuse")
 '''
 
-    with open(config_file, 'w', encoding='utf-8') as f:
-        f.write(config_content)
+def get_venv_jupyter_config_dir():
+    """Get Jupyter config directory in current virtual environment"""
+    venv_path = Path(sys.prefix)
+    return venv_path / "etc" / "jupyter"
+
+@contextmanager
+def _map_config(config_file):
+    """Map config file read-only for substring checks without copying it (b'' if empty)"""
+    with open(config_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''  # mmap cannot map an empty file
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def _has_fewer_lines(data, limit):
+    """Check whether data contains fewer than limit newlines, stopping early"""
+    pos = 0
+    for _ in range(limit):
+        pos = data.find(b'\n', pos) + 1
+        if not pos:
+            return True
+    return False
+
+def create_config():
+    """Create or recreate Jupyter server configuration file"""
+    config_dir = get_venv_jupyter_config_dir()
+    config_dir.mkdir(parents=True, exist_ok=True)
+
+    config_file = config_dir / "jupyter_server_config.py"
+
+    config_file.write_text(_CONFIG_TEMPLATE, encoding='utf-8')
 
     return config_file
 
+def _probe_package():
+    """Import the sticky managers (pulls in jupyter_server)"""
+    from DarkPyonix_km.manager import StickyMappingKernelManager, StickySessionManager
+
+def _probe_jupyter_server():
+    """Import jupyter_server and return its version"""
+    import jupyter_server
+    return jupyter_server.__version__
+
+def _probe_config_file(config_file):
+    """Return (exists, has DarkPyonix settings, read error) for the config file"""
+    if not config_file.exists():
+        return False, False, None
+    try:
+        with _map_config(config_file) as data:
+            return True, data.find(b'StickyMappingKernelManager') != -1, None
+    except Exception as e:
+        return True, False, e
+
 def check_installation():
     """Check DarkPyonix installation status and configuration"""
     print("🔍 DarkPyonix Installation Check")
     print("=" * 40)
 
+    from concurrent.futures import ThreadPoolExecutor  # only needed here; keeps other subcommands fast
+
     issues = []
+    config_dir = get_venv_jupyter_config_dir()
+    config_file = config_dir / "jupyter_server_config.py"
+
+    # Read the config file while the imports run (the two imports share jupyter_server's
+    # import lock, so they don't overlap each other); report in order below
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        package_probe = pool.submit(_probe_package)
+        server_probe = pool.submit(_probe_jupyter_server)
+        config_probe = pool.submit(_probe_config_file, config_file)
 
     # 1. Check package import
     try:
-        from DarkPyonix_km.manager import StickyMappingKernelManager, StickySessionManager
+        package_probe.result()
         print("✅ DarkPyonix package: OK")
     except ImportError as e:
         print(f"❌ DarkPyonix package: Failed - {e}")
@@ -60,31 +118,25 @@ def check_installation():
 
     # 2. Check Jupyter Server installation
     try:
-        import jupyter_server
-        print(f"✅ Jupyter Server: OK (v{jupyter_server.__version__})")
+        print(f"✅ Jupyter Server: OK (v{server_probe.result()})")
     except ImportError as e:
         print(f"❌ Jupyter Server: Failed - {e}")
         issues.append("Jupyter Server not installed")
 
     # 3. Check config file
-    config_dir = get_venv_jupyter_config_dir()
-    config_file = config_dir / "jupyter_server_config.py"
-
-    if config_file.exists():
+    exists, found, read_error = config_probe.result()
+    if exists:
         print(f"✅ Config file: {config_file}")
 
         # Check if config contains DarkPyonix settings
-        try:
-            with open(config_file, 'r') as f:
-                content = f.read()
-                if 'StickyMappingKernelManager' in content:
-                    print("✅ DarkPyonix settings: Found in config")
-                else:
-                    print("⚠️  DarkPyonix settings: Missing from config")
-                    issues.append("Config file exists but missing DarkPyonix settings")
-        except Exception as e:
-            print(f"⚠️  Config file: Cannot read - {e}")
+        if read_error is not None:
+            print(f"⚠️  Config file: Cannot read - {read_error}")
             issues.append("Config file unreadable")
+        elif found:
+            print("✅ DarkPyonix settings: Found in config")
+        else:
+            print("⚠️  DarkPyonix settings: Missing from config")
+            issues.append("Config file exists but missing DarkPyonix settings")
     else:
         print(f"❌ Config file: Missing - {config_file}")
         issues.append("Config file missing")
@@ -140,6 +192,9 @@ def show_usage():
    # Optional: Project isolation
    export STICKYKM_NAMESPACE="my-project-2025"
    
+   # Optional: Resolve symlinks so symlinked notebooks share one kernel
+   export STICKYKM_RESOLVE_SYMLINKS=1
+   
    # Optional: Custom config location
    export JUPYTER_CONFIG_DIR="/path/to/config"
 """)
@@ -152,33 +207,21 @@ def clean_config():
     if config_file.exists():
         # Check if file contains only DarkPyonix config
         try:
-            with open(config_file, 'r') as f:
-                content = f.read()
+            with _map_config(config_file) as data:
+                generated = data.find(b'DarkPyonix') != -1 and _has_fewer_lines(data, 20)
+                # Only decode when we have to rewrite the file
+                content = None if generated else data[:].decode('utf-8').replace('\r\n', '\n')
 
-            if 'DarkPyonix' in content and content.count('\n') < 20:
+            if generated:
                 # Looks like our auto-generated config, safe to remove
                 config_file.unlink()
                 print(f"✅ Removed DarkPyonix config: {config_file}")
             else:
                 # File contains other settings, just remove our parts
-                lines = content.split('\n')
-                new_lines = []
-                skip_block = False
-
-                for line in lines:
-                    if 'DarkPyonix' in line or 'StickyMappingKernelManager' in line or 'StickySessionManager' in line:
-                        skip_block = True
-                        continue
-                    if skip_block and line.strip() == '':
-                        continue
-                    if skip_block and not line.startswith('c.') and not line.startswith('#') and not line.startswith('print'):
-                        skip_block = False
-                    if not skip_block:
-                        new_lines.append(line)
-
-                if new_lines and any(line.strip() for line in new_lines):
-                    with open(config_file, 'w') as f:
-                        f.write('\n'.join(new_lines))
+                new_content = _DARKPYONIX_BLOCK_RE.sub('', content)
+
+                if new_content.strip():
+                    config_file.write_text(new_content, encoding='utf-8')
                     print(f"✅ Removed DarkPyonix settings from: {config_file}")
                 else:
                     config_file.unlink()
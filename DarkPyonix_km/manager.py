@@ -2,9 +2,14 @@
 from __future__ import annotations
 
 import os
+import time
 import uuid
+import hashlib
 import logging
-from typing import Optional, Dict, Any
+import functools
+from typing import Optional, Dict, Any, Tuple
+
+from traitlets import observe
 
 try:
     from jupyter_server.services.kernels.kernelmanager import MappingKernelManager
@@ -14,8 +19,34 @@ except ImportError:  # nbclassic compatibility
     from notebook.services.sessions.sessionmanager import SessionManager  # type: ignore
 
 DEFAULT_NAMESPACE = uuid.UUID("f2a57b34-7b27-43e9-87fd-1b7e9f9d5d6a")
+_POSIX = os.sep == "/"
+ALIVE_CACHE_TTL = 0.25  # seconds an is_alive() result is reused across reconnect bursts
+CACHE_TRIM_THRESHOLD = 512  # path/ID memo caches are cleared on kernel shutdown past this size
+
+# Configured once at import; shared by every manager instance
+_STICKY_LOG = logging.getLogger("StickyKM")
+if not _STICKY_LOG.handlers:
+    _h = logging.StreamHandler()
+    _h.setFormatter(logging.Formatter("[%(name)s] %(levelname)s - %(message)s"))
+    _STICKY_LOG.addHandler(_h)
+    del _h
+if _STICKY_LOG.level == logging.NOTSET:
+    _STICKY_LOG.setLevel(logging.INFO)  # keep a level set earlier (e.g. DEBUG from jupyter config)
 
 # ---------- utils ----------
+@functools.lru_cache(maxsize=1)
+def _resolve_symlinks() -> bool:
+    """
+    Check whether symlinks should be resolved when normalizing notebook paths.
+
+    Off by default; set STICKYKM_RESOLVE_SYMLINKS=1 so that a notebook opened
+    through different symlinked paths maps to the same kernel.
+
+    Returns:
+        True if realpath canonicalization is enabled
+    """
+    return os.environ.get("STICKYKM_RESOLVE_SYMLINKS") == "1"
+
 def _abs_norm(root_dir: Optional[str], raw_path: Optional[str]) -> str:
     """
     Convert relative path to absolute path and normalize it.
@@ -30,8 +61,30 @@ def _abs_norm(root_dir: Optional[str], raw_path: Optional[str]) -> str:
     if not raw_path:
         return ""
     base = root_dir or os.getcwd()
-    p = raw_path if os.path.isabs(raw_path) else os.path.join(base, raw_path)
-    p = os.path.abspath(os.path.realpath(p))
+    if _POSIX and not base.endswith("/"):
+        base += "/"  # callers can pass a pre-slashed root_dir to skip this copy
+    return _abs_norm_cached(base, raw_path)
+
+@functools.lru_cache(maxsize=2048)
+def _abs_norm_cached(base: str, raw_path: str) -> str:
+    """
+    Cached body of _abs_norm, keyed on the already-resolved base directory.
+    Avoids re-resolving the same notebook path on every kernel start.
+    Call _abs_norm_cached.cache_clear() if the filesystem layout changes.
+
+    Args:
+        base: Resolved base directory (root_dir or cwd); ends with "/" on POSIX
+        raw_path: Non-empty raw path that might be relative
+
+    Returns:
+        Normalized absolute path
+    """
+    if _POSIX:
+        p = raw_path if raw_path.startswith("/") else base + raw_path
+    else:
+        p = raw_path if os.path.isabs(raw_path) else os.path.join(base, raw_path)
+    # base is absolute (server root_dir or cwd), so p already is; realpath/normpath alone suffice
+    p = os.path.realpath(p) if _resolve_symlinks() else os.path.normpath(p)
     if os.name == "nt":
         p = os.path.normcase(p)  # Windows case normalization
     return p
@@ -51,29 +104,43 @@ def _pick_path_from_kwargs(kwargs: Dict[str, Any]) -> str:
     Returns:
         Extracted path or empty string
     """
-    raw = kwargs.get("path") or ""
+    raw = kwargs.get("path")
     if raw:
         return raw
-    env = kwargs.get("env") or {}
+    env = kwargs.get("env")
+    if not env:
+        return ""
     return env.get("JPY_SESSION_NAME") or env.get("NOTEBOOK_PATH") or ""
 
-def _stable_kernel_id(abs_path: str, kernel_name: str, ns: uuid.UUID) -> str:
+@functools.lru_cache(maxsize=1024)
+def _stable_kernel_id(abs_path: str, kernel_name: Optional[str]) -> str:
     """
     Generate deterministic kernel ID based on file path and kernel type only (user-agnostic).
+    Memoized, since the same notebook is reopened many times over a server's lifetime.
+
+    Equivalent to str(uuid.uuid5(_namespace(), f"{abs_path}|{kernel_name}")), computed
+    directly from the SHA-1 digest to skip the intermediate UUID object.
 
     Args:
         abs_path: Absolute file path
-        kernel_name: Kernel type (e.g., "python3")
-        ns: UUID namespace for hashing
+        kernel_name: Kernel type (e.g., "python3"); None is hashed as "None", as the f-string did
 
     Returns:
         Deterministic kernel ID that's same for same file path
     """
-    return str(uuid.uuid5(ns, f"{abs_path}|{kernel_name}"))
-
+    h = hashlib.sha1(_NS_BYTES)
+    h.update(abs_path.encode("utf-8"))
+    h.update(_KERNEL_NAME_ENC.get(kernel_name) or ("|" + str(kernel_name)).encode("utf-8"))
+    d = bytearray(h.digest()[:16])
+    d[6] = (d[6] & 0x0F) | 0x50  # version 5
+    d[8] = (d[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return f"{d[:4].hex()}-{d[4:6].hex()}-{d[6:8].hex()}-{d[8:10].hex()}-{d[10:].hex()}"
+
+@functools.lru_cache(maxsize=1)
 def _namespace() -> uuid.UUID:
     """
     Get UUID namespace from environment variable or use default.
+    Resolved once per process; the environment is fixed for the server's lifetime.
 
     Returns:
         UUID namespace for kernel ID generation
@@ -84,6 +151,9 @@ def _namespace() -> uuid.UUID:
     except Exception:
         return DEFAULT_NAMESPACE
 
+_NS_BYTES = _namespace().bytes
+_KERNEL_NAME_ENC = {"python3": b"|python3"}  # pre-encoded "|<kernel_name>" suffixes
+
 # ---------- MappingKernelManager ----------
 class StickyMappingKernelManager(MappingKernelManager):
     """
@@ -92,26 +162,73 @@ class StickyMappingKernelManager(MappingKernelManager):
     """
 
     _path_to_kernel_id: Dict[str, str]
+    _root_dir: Optional[str]
+    _root_dir_slashed: Optional[str]
+    _alive_cache: Dict[str, Tuple[float, bool]]
 
     def __init__(self, *a, **kw):
-        """Initialize the sticky kernel manager with logging setup."""
+        """Initialize the sticky kernel manager."""
         super().__init__(*a, **kw)
         self._path_to_kernel_id = {}
-        self.sticky_logger = logging.getLogger("StickyKM")
-        if not self.sticky_logger.handlers:
-            h = logging.StreamHandler()
-            h.setFormatter(logging.Formatter("[%(name)s] %(asctime)s - %(levelname)s - %(message)s"))
-            self.sticky_logger.addHandler(h)
-        self.sticky_logger.setLevel(logging.INFO)
+        self._alive_cache = {}
+        self._set_root_dir(getattr(getattr(self, "parent", None), "root_dir", None))
+        self.sticky_logger = _STICKY_LOG
         if getattr(self, "log", None):
-            self.log.info("[StickyKM] initialized (root_dir=%s)", getattr(self.parent, "root_dir", None))
-        self.sticky_logger.info("initialized (root_dir=%s)", getattr(self.parent, "root_dir", None))
+            self.log.info("[StickyKM] initialized (root_dir=%s)", self._root_dir)
+        self.sticky_logger.info("initialized (root_dir=%s)", self._root_dir)
+
+    @observe("parent")
+    def _parent_changed(self, change):
+        """Refresh the cached root_dir when the manager is re-parented."""
+        self._set_root_dir(getattr(change["new"], "root_dir", None))
+
+    def _set_root_dir(self, root_dir: Optional[str]):
+        """Cache root_dir, plus a "/"-terminated copy on POSIX for _abs_norm (unchanged on Windows)."""
+        self._root_dir = root_dir
+        self._root_dir_slashed = (root_dir.rstrip("/") + "/") if root_dir and _POSIX else root_dir
+
+    def _debug_enabled(self) -> bool:
+        """Check whether either logger would emit a debug record."""
+        if self.sticky_logger.isEnabledFor(logging.DEBUG):
+            return True
+        log = getattr(self, "log", None)
+        return bool(log) and log.isEnabledFor(logging.DEBUG)
+
+    def _debug(self, msg: str, *args):
+        """Log debug message to both custom logger and Jupyter's built-in logger (lazy %-formatting)."""
+        self.sticky_logger.debug(msg, *args)
+        log = getattr(self, "log", None)
+        if log and log.isEnabledFor(logging.DEBUG):
+            log.debug("[StickyKM] " + msg, *args)
+
+    def _is_alive(self, kernel_id: str, km) -> bool:
+        """
+        Check whether a kernel is alive, reusing a result younger than ALIVE_CACHE_TTL.
 
-    def _debug(self, msg: str):
-        """Log debug message to both custom logger and Jupyter's built-in logger."""
-        self.sticky_logger.info(msg)
-        if getattr(self, "log", None):
-            self.log.info(f"[StickyKM] {msg}")
+        Args:
+            kernel_id: Kernel ID the manager is registered under
+            km: Kernel manager for that kernel
+
+        Returns:
+            True if the kernel is (assumed) alive
+        """
+        now = time.monotonic()
+        cached = self._alive_cache.get(kernel_id)
+        if cached and now - cached[0] < ALIVE_CACHE_TTL:
+            return cached[1]
+        try:
+            alive = km.is_alive()
+        except Exception:
+            alive = True  # Assume alive if can't check
+        self._alive_cache[kernel_id] = (now, alive)
+        return alive
+
+    def _forget_kernel(self, kernel_id: str):
+        """Drop cached state for a kernel and trim the path/ID memo caches if they grew large."""
+        self._alive_cache.pop(kernel_id, None)
+        for cache in (_stable_kernel_id, _abs_norm_cached):
+            if cache.cache_info().currsize > CACHE_TRIM_THRESHOLD:
+                cache.cache_clear()
 
     def _propose_id(self, abs_path: str, kernel_name: str) -> str:
         """
@@ -124,7 +241,7 @@ class StickyMappingKernelManager(MappingKernelManager):
         Returns:
             Proposed deterministic kernel ID
         """
-        return _stable_kernel_id(abs_path, kernel_name, _namespace())
+        return _stable_kernel_id(abs_path, kernel_name)
 
     def start_kernel(self, **kwargs):
         """
@@ -136,43 +253,43 @@ class StickyMappingKernelManager(MappingKernelManager):
         Returns:
             Kernel ID (either reused or newly created)
         """
-        self._debug(
-            "start_kernel kwargs={"
-            + ", ".join(f"{k}={'...env...' if k=='env' else repr(v)}" for k, v in kwargs.items())
-            + "}"
-        )
+        if self._debug_enabled():
+            self._debug(
+                "start_kernel kwargs={%s}",
+                ", ".join(f"{k}={'...env...' if k=='env' else repr(v)}" for k, v in kwargs.items()),
+            )
         kernel_id = kwargs.pop("kernel_id", None)
+        if kernel_id is not None:
+            # Explicit kernel_id: no path resolution or reuse lookup needed
+            self._debug("Starting kernel (explicit id=%s)", kernel_id)
+            return super().start_kernel(kernel_id=kernel_id, **kwargs)
         kernel_name = kwargs.get("kernel_name", "python3")
 
         # Extract and normalize file path
         raw_path = _pick_path_from_kwargs(kwargs)
-        abs_path = _abs_norm(getattr(self.parent, "root_dir", None) if hasattr(self, "parent") else None, raw_path)
-        self._debug(f"chosen raw_path='{raw_path}', abs_path='{abs_path}', kernel_name='{kernel_name}'")
+        abs_path = _abs_norm(self._root_dir_slashed, raw_path)
+        self._debug("chosen raw_path='%s', abs_path='%s', kernel_name='%s'", raw_path, abs_path, kernel_name)
 
         if abs_path:
             kwargs["path"] = abs_path  # Pass absolute path downstream
 
-        # Apply reuse logic if no specific kernel_id and we have a file path
-        if kernel_id is None and abs_path:
+        # Apply reuse logic if we have a file path
+        if abs_path:
             proposed = self._propose_id(abs_path, kernel_name)
             if proposed in self._kernels:
-                km = self._kernels[proposed]
-                try:
-                    alive = km.is_alive()
-                except Exception:
-                    alive = True  # Assume alive if can't check
-                if alive:
-                    self._debug(f"Reusing shared kernel_id={proposed} for abs_path={abs_path}")
+                if self._is_alive(proposed, self._kernels[proposed]):
+                    self._debug("Reusing shared kernel_id=%s for abs_path=%s", proposed, abs_path)
                     return proposed
-                self._debug(f"Kernel {proposed} dead; starting new.")
+                self._alive_cache.pop(proposed, None)  # don't let the stale result shadow the new kernel
+                self._debug("Kernel %s dead; starting new.", proposed)
 
             kernel_id = proposed
 
-        # Start new kernel or use provided kernel_id
-        self._debug(f"Starting kernel (final id={kernel_id})")
+        # Start new kernel (parent generates an id if no path was found)
+        self._debug("Starting kernel (final id=%s)", kernel_id)
         rid = kernel_id if kernel_id is not None else "<parent-generated>"
         out = super().start_kernel(kernel_id=kernel_id, **kwargs)
-        self._debug(f"Started kernel; id={rid}")
+        self._debug("Started kernel; id=%s", rid)
         return out
 
     async def start_kernel_async(self, **kwargs):
@@ -185,39 +302,61 @@ class StickyMappingKernelManager(MappingKernelManager):
         Returns:
             Kernel ID (either reused or newly created)
         """
-        self._debug(
-            "start_kernel_async kwargs={"
-            + ", ".join(f"{k}={'...env...' if k=='env' else repr(v)}" for k, v in kwargs.items())
-            + "}"
-        )
+        if self._debug_enabled():
+            self._debug(
+                "start_kernel_async kwargs={%s}",
+                ", ".join(f"{k}={'...env...' if k=='env' else repr(v)}" for k, v in kwargs.items()),
+            )
         kernel_id = kwargs.pop("kernel_id", None)
+        if kernel_id is not None:
+            # Explicit kernel_id: no path resolution or reuse lookup needed
+            self._debug("(async) Starting kernel (explicit id=%s)", kernel_id)
+            return await super().start_kernel_async(kernel_id=kernel_id, **kwargs)
         kernel_name = kwargs.get("kernel_name", "python3")
 
         # Extract and normalize file path
         raw_path = _pick_path_from_kwargs(kwargs)
-        abs_path = _abs_norm(getattr(self.parent, "root_dir", None) if hasattr(self, "parent") else None, raw_path)
-        self._debug(f"(async) chosen raw_path='{raw_path}', abs_path='{abs_path}', kernel_name='{kernel_name}'")
+        abs_path = _abs_norm(self._root_dir_slashed, raw_path)
+        self._debug("(async) chosen raw_path='%s', abs_path='%s', kernel_name='%s'", raw_path, abs_path, kernel_name)
 
         if abs_path:
             kwargs["path"] = abs_path
 
-        # Apply reuse logic if no specific kernel_id and we have a file path
-        if kernel_id is None and abs_path:
+        # Apply reuse logic if we have a file path
+        if abs_path:
             proposed = self._propose_id(abs_path, kernel_name)
             if proposed in self._kernels:
-                km = self._kernels[proposed]
-                try:
-                    alive = km.is_alive()
-                except Exception:
-                    alive = True  # Assume alive if can't check
-                if alive:
-                    self._debug(f"(async) Reusing shared kernel_id={proposed} for abs_path={abs_path}")
+                if self._is_alive(proposed, self._kernels[proposed]):
+                    self._debug("(async) Reusing shared kernel_id=%s for abs_path=%s", proposed, abs_path)
                     return proposed
+                self._alive_cache.pop(proposed, None)  # don't let the stale result shadow the new kernel
             kernel_id = proposed
 
         # Start new kernel asynchronously
-        self._debug(f"(async) Starting kernel (final id={kernel_id})")
+        self._debug("(async) Starting kernel (final id=%s)", kernel_id)
         out = await super().start_kernel_async(kernel_id=kernel_id, **kwargs)
         rid = kernel_id if kernel_id is not None else "<parent-generated>"
-        self._debug(f"(async) Started kernel; id={rid}")
+        self._debug("(async) Started kernel; id=%s", rid)
         return out
+
+    def shutdown_kernel(self, kernel_id, *args, **kwargs):
+        """
+        Shut down a kernel and invalidate its cached liveness.
+
+        Args:
+            kernel_id: Kernel ID to shut down
+            *args, **kwargs: Passed through to the parent implementation
+        """
+        self._forget_kernel(kernel_id)
+        return super().shutdown_kernel(kernel_id, *args, **kwargs)
+
+    async def shutdown_kernel_async(self, kernel_id, *args, **kwargs):
+        """
+        Async version of shutdown_kernel with the same cache invalidation.
+
+        Args:
+            kernel_id: Kernel ID to shut down
+            *args, **kwargs: Passed through to the parent implementation
+        """
+        self._forget_kernel(kernel_id)
+        return await super().shutdown_kernel_async(kernel_id, *args, **kwargs)
@@ -6,20 +6,8 @@ from setuptools import setup, find_packages
 from setuptools.command.install import install
 from setuptools.command.develop import develop
 
-def create_jupyter_config():
-    """Create Jupyter configuration file in current virtual environment"""
-
-    # Check virtual environment path
-    venv_path = Path(sys.prefix)
-
-    # Create jupyter config directory inside virtual environment
-    jupyter_config_dir = venv_path / "etc" / "jupyter"
-    jupyter_config_dir.mkdir(parents=True, exist_ok=True)
-
-    # Create jupyter_server_config.py
-    config_file = jupyter_config_dir / "jupyter_server_config.py"
-
-    config_content = '''# DarkPyonix Auto-Generated Configuration
+# Kept here rather than imported from DarkPyonix_km: the package is not importable during install
+_CONFIG_TEMPLATE = '''# DarkPyonix Auto-Generated Configuration
 # This file was automatically generated during DarkPyonix installation.
 c = get_config()  #noqa
 
@@ -35,8 +23,20 @@ c.ServerApp.kernel_manager_class = StickyMappingKernelManager
 c.ServerApp.log_level = 'INFO'
 '''
 
-    with open(config_file, 'w', encoding='utf-8') as f:
-        f.write(config_content)
+def create_jupyter_config():
+    """Create Jupyter configuration file in current virtual environment"""
+
+    # Check virtual environment path
+    venv_path = Path(sys.prefix)
+
+    # Create jupyter config directory inside virtual environment
+    jupyter_config_dir = venv_path / "etc" / "jupyter"
+    jupyter_config_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create jupyter_server_config.py
+    config_file = jupyter_config_dir / "jupyter_server_config.py"
+
+    config_file.write_text(_CONFIG_TEMPLATE, encoding='utf-8')
 
     print(f"[OK] Jupyter config file created: {config_file}")
 
@@ -60,8 +60,7 @@ export STICKYKM_NAMESPACE="default-{venv_path.name}"
 echo "DarkPyonix environment activated!"
 '''
 
-    with open(env_script, 'w') as f:
-        f.write(env_content)
+    env_script.write_text(env_content, encoding='utf-8')
 
     if not os.name == "nt":
         os.chmod(env_script, 0o755)
@@ -88,8 +87,7 @@ def modify_activate_script(venv_path, jupyter_config_dir):
         return
 
     # Read existing content
-    with open(activate_script, 'r') as f:
-        content = f.read()
+    content = activate_script.read_text(encoding='utf-8')
 
     # Check if DarkPyonix configuration already exists
     if "DarkPyonix" in content:
@@ -139,7 +137,7 @@ setup(
     author="Your Name",
     author_email="your.email@example.com",
     description="Sticky Kernel Manager for Jupyter - File-based kernel reuse",
-    long_description=open("README.md", encoding='utf-8').read(),
+    long_description=Path("README.md").read_text(encoding='utf-8'),
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/DarkPyonix",
     packages=find_packages(),